@@ -17,7 +17,7 @@ class AsyncStatus(Status):
         awaitable: Awaitable,
         watchers: Optional[List[Callable]] = None,
     ):
-        if isinstance(awaitable, asyncio.Task):
+        if isinstance(awaitable, asyncio.Future):
             self.task = awaitable
         else:
             self.task = asyncio.create_task(awaitable)  # type: ignore
@@ -75,6 +75,13 @@ class AsyncStatus(Status):
         if self._watchers is not None:
             self._watchers.append(watcher)
 
+    @classmethod
+    def completed(cls) -> "AsyncStatus":
+        """A Status that is already done, without scheduling a coroutine"""
+        fut = asyncio.get_running_loop().create_future()
+        fut.set_result(None)
+        return cls(fut)
+
     @classmethod
     def wrap(cls, f: Callable[[T], Coroutine]) -> Callable[[T], "AsyncStatus"]:
         @functools.wraps(f)
@@ -91,6 +98,10 @@ class AsyncStatus(Status):
                 status = "done"
         else:
             status = "pending"
-        return f"<{type(self).__name__}, task: {self.task.get_coro()}, {status}>"
+        if isinstance(self.task, asyncio.Task):
+            task = self.task.get_coro()
+        else:
+            task = self.task
+        return f"<{type(self).__name__}, task: {task}, {status}>"
 
     __str__ = __repr__
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 import asyncio
-import functools
+import sys
+from collections import deque
 from typing import (
     Any,
     AsyncGenerator,
     Callable,
+    Deque,
     Dict,
     Generic,
     Mapping,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
 )
+from weakref import WeakKeyDictionary
 
 from bluesky.protocols import (
     DataKey,
@@ -32,15 +36,14 @@ from .signal_backend import SignalBackend
 from .sim_signal_backend import SimSignalBackend
 from .utils import DEFAULT_TIMEOUT, Callback, ReadingValueCallback, T
 
-_sim_backends: Dict[Signal, SimSignalBackend] = {}
+# Weakly keyed so discarded device trees don't keep their sim signals alive
+_sim_backends: WeakKeyDictionary[Signal, SimSignalBackend] = WeakKeyDictionary()
 
-
-def _add_timeout(func):
-    @functools.wraps(func)
-    async def wrapper(self: Signal, *args, **kwargs):
-        return await asyncio.wait_for(func(self, *args, **kwargs), self._timeout)
-
-    return wrapper
+if sys.version_info >= (3, 11):
+    _timeout_cm = asyncio.timeout
+else:
+    # asyncio.timeout is new in 3.11, so use the backport on older versions
+    from async_timeout import timeout as _timeout_cm
 
 
 def _fail(self, other, *args, **kwargs):
@@ -79,7 +82,13 @@ class Signal(Device, Generic[T]):
         """Like ca://PV_PREFIX:SIGNAL, or "" if not set"""
         return self._backend.source(self.name)
 
-    __lt__ = __le__ = __eq__ = __ge__ = __gt__ = __ne__ = _fail
+    def __eq__(self, other) -> bool:
+        # Identity equality, so set/dict lookups (e.g. _sim_backends) stay on
+        # the fast path rather than detouring through _fail. Ordering
+        # comparisons still raise as they are always a user error.
+        return self is other
+
+    __lt__ = __le__ = __ge__ = __gt__ = _fail
 
     def __hash__(self):
         # Restore the default implementation so we can use in a set or dict
@@ -89,8 +98,10 @@ class Signal(Device, Generic[T]):
 class _SignalCache(Generic[T]):
     def __init__(self, backend: SignalBackend[T], signal: Signal):
         self._signal = signal
+        self._name = signal.name
         self._staged = False
-        self._listeners: Dict[Callback, bool] = {}
+        self._value_listeners: Set[Callback[T]] = set()
+        self._reading_listeners: Set[Callback[Dict[str, Reading]]] = set()
         self._valid = asyncio.Event()
         self._reading: Optional[Reading] = None
         self._value: Optional[T] = None
@@ -115,27 +126,38 @@ class _SignalCache(Generic[T]):
         self._reading = reading
         self._value = value
         self._valid.set()
-        for function, want_value in self._listeners.items():
-            self._notify(function, want_value)
+        if not self._value_listeners and not self._reading_listeners:
+            # Staged but not subscribed, nothing to dispatch
+            return
+        for function in self._value_listeners:
+            function(value)
+        if self._reading_listeners:
+            # Build the reading dict once and broadcast it
+            reading_dict = {self._name: reading}
+            for function in self._reading_listeners:
+                function(reading_dict)
 
-    def _notify(self, function: Callback, want_value: bool):
+    def subscribe(self, function: Callback, want_value: bool) -> None:
         if want_value:
-            function(self._value)
+            self._value_listeners.add(function)
+            if self._valid.is_set():
+                function(self._value)
         else:
-            function({self._signal.name: self._reading})
+            self._reading_listeners.add(function)
+            if self._valid.is_set():
+                function({self._name: self._reading})
 
-    def subscribe(self, function: Callback, want_value: bool) -> None:
-        self._listeners[function] = want_value
-        if self._valid.is_set():
-            self._notify(function, want_value)
+    def _has_listeners(self) -> bool:
+        return bool(self._value_listeners or self._reading_listeners)
 
     def unsubscribe(self, function: Callback) -> bool:
-        self._listeners.pop(function)
-        return self._staged or bool(self._listeners)
+        self._value_listeners.discard(function)
+        self._reading_listeners.discard(function)
+        return self._staged or self._has_listeners()
 
     def set_staged(self, staged: bool):
         self._staged = staged
-        return self._staged or bool(self._listeners)
+        return self._staged or self._has_listeners()
 
 
 class SignalR(Signal[T], AsyncReadable, AsyncStageable, Subscribable):
@@ -165,20 +187,23 @@ class SignalR(Signal[T], AsyncReadable, AsyncStageable, Subscribable):
             self._cache.close()
             self._cache = None
 
-    @_add_timeout
+    # Timeouts are inlined rather than decorated on, so each call avoids the
+    # varargs packing and extra frame of a generic wrapper
+
     async def read(self, cached: Optional[bool] = None) -> Dict[str, Reading]:
         """Return a single item dict with the reading in it"""
-        return {self.name: await self._backend_or_cache(cached).get_reading()}
+        async with _timeout_cm(self._timeout):
+            return {self.name: await self._backend_or_cache(cached).get_reading()}
 
-    @_add_timeout
     async def describe(self) -> Dict[str, DataKey]:
         """Return a single item dict with the descriptor in it"""
-        return {self.name: await self._backend.get_datakey(self.source)}
+        async with _timeout_cm(self._timeout):
+            return {self.name: await self._backend.get_datakey(self.source)}
 
-    @_add_timeout
     async def get_value(self, cached: Optional[bool] = None) -> T:
         """The current value"""
-        return await self._backend_or_cache(cached).get_value()
+        async with _timeout_cm(self._timeout):
+            return await self._backend_or_cache(cached).get_value()
 
     def subscribe_value(self, function: Callback[T]):
         """Subscribe to updates in value of a device"""
@@ -192,18 +217,21 @@ class SignalR(Signal[T], AsyncReadable, AsyncStageable, Subscribable):
         """Remove a subscription."""
         self._del_cache(self._get_cache().unsubscribe(function))
 
-    @AsyncStatus.wrap
-    async def stage(self) -> None:
+    def stage(self) -> AsyncStatus:
         """Start caching this signal"""
         self._get_cache().set_staged(True)
+        # The cache ops are synchronous, so no need to schedule a coroutine
+        return AsyncStatus.completed()
 
-    @AsyncStatus.wrap
-    async def unstage(self) -> None:
+    def unstage(self) -> AsyncStatus:
         """Stop caching this signal"""
         self._del_cache(self._get_cache().set_staged(False))
+        return AsyncStatus.completed()
 
 
-USE_DEFAULT_TIMEOUT = "USE_DEFAULT_TIMEOUT"
+# Unique sentinel so the default-timeout check is a guaranteed identity
+# compare, with no chance of colliding with a real value
+USE_DEFAULT_TIMEOUT = object()
 
 
 class SignalW(Signal[T], Movable):
@@ -367,6 +395,37 @@ def assert_emitted(docs: Mapping[str, list[dict]], **numbers: int):
     assert {name: len(d) for name, d in docs.items()} == numbers
 
 
+class _ValueQueue(Generic[T]):
+    """A minimal single-consumer queue for monitor updates.
+
+    Unlike `asyncio.Queue`, the common case where the consumer is already
+    waiting hands the value straight to its Future without any deque
+    operations or wakeup bookkeeping.
+    """
+
+    def __init__(self):
+        self._waiter: Optional[asyncio.Future[T]] = None
+        self._pending: Deque[T] = deque()
+
+    def put_nowait(self, value: T):
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            self._waiter = None
+            waiter.set_result(value)
+        else:
+            self._pending.append(value)
+
+    async def get(self) -> T:
+        if self._pending:
+            return self._pending.popleft()
+        assert self._waiter is None, "Only a single consumer is supported"
+        self._waiter = asyncio.get_running_loop().create_future()
+        try:
+            return await self._waiter
+        finally:
+            self._waiter = None
+
+
 async def observe_value(signal: SignalR[T], timeout=None) -> AsyncGenerator[T, None]:
     """Subscribe to the value of a signal so it can be iterated from.
 
@@ -375,6 +434,10 @@ async def observe_value(signal: SignalR[T], timeout=None) -> AsyncGenerator[T, N
     signal:
         Call subscribe_value on this at the start, and clear_sub on it at the
         end
+    timeout:
+        Maximum time to wait between updates. Callers wanting a total timeout
+        should leave this as None and wrap the iteration in a timeout context
+        instead
 
     Notes
     -----
@@ -383,18 +446,18 @@ async def observe_value(signal: SignalR[T], timeout=None) -> AsyncGenerator[T, N
         async for value in observe_value(sig):
             do_something_with(value)
     """
-    q: asyncio.Queue[T] = asyncio.Queue()
-    if timeout is None:
-        get_value = q.get
-    else:
-
-        async def get_value():
-            return await asyncio.wait_for(q.get(), timeout)
-
+    q: _ValueQueue[T] = _ValueQueue()
     signal.subscribe_value(q.put_nowait)
     try:
-        while True:
-            yield await get_value()
+        if timeout is None:
+            # Fast path with no timeout bookkeeping per value
+            while True:
+                yield await q.get()
+        else:
+            while True:
+                async with _timeout_cm(timeout):
+                    value = await q.get()
+                yield value
     finally:
         signal.clear_sub(q.put_nowait)
 
@@ -413,7 +476,8 @@ class _ValueChecker(Generic[T]):
 
     async def wait_for_value(self, signal: SignalR[T], timeout: Optional[float]):
         try:
-            await asyncio.wait_for(self._wait_for_value(signal), timeout)
+            async with _timeout_cm(timeout):
+                await self._wait_for_value(signal)
         except asyncio.TimeoutError as e:
             raise TimeoutError(
                 f"{signal.name} didn't match {self._matcher_name} in {timeout}s, "
@@ -1,8 +1,9 @@
+import functools
 import logging
 import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, Sequence, Type, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Type, Union
 
 from aioca import (
     FORMAT_CTRL,
@@ -14,7 +15,7 @@ from aioca import (
     camonitor,
     caput,
 )
-from aioca.types import AugmentedValue, Dbr, Format
+from aioca.types import AugmentedValue, Dbr
 from bluesky.protocols import DataKey, Dtype, Reading
 from epicscorelibs.ca import dbr
 
@@ -39,6 +40,10 @@ dbr_to_dtype: Dict[Dbr, Dtype] = {
     dbr.DBR_DOUBLE: "number",
 }
 
+# EPICS severities are 0=NO_ALARM, 1=MINOR, 2=MAJOR, 3=INVALID; anything above
+# MAJOR is reported as -1 (with some slack in case of out-of-range values)
+_severity_to_alarm = (0, 1, 2, -1, -1, -1)
+
 
 @dataclass
 class CaConverter:
@@ -55,7 +60,7 @@ class CaConverter:
         return {
             "value": self.value(value),
             "timestamp": value.timestamp,
-            "alarm_severity": -1 if value.severity > 2 else value.severity,
+            "alarm_severity": _severity_to_alarm[value.severity],
         }
 
     def get_datakey(self, source: str, value: AugmentedValue) -> DataKey:
@@ -96,59 +101,119 @@ class CaEnumConverter(CaConverter):
 
 
 class DisconnectedCaConverter(CaConverter):
-    def __getattribute__(self, __name: str) -> Any:
+    # Override each public method rather than __getattribute__, so implicit
+    # attribute probes like repr and isinstance stay on the C-level fast path
+    def _not_connected(self, *args, **kwargs) -> Any:
         raise NotImplementedError("No PV has been set as connect() has not been called")
 
+    write_value = _not_connected
+    value = _not_connected
+    reading = _not_connected
+    get_datakey = _not_connected
 
-def make_converter(
-    datatype: Optional[Type], values: Dict[str, AugmentedValue]
+
+# Stateless and never mutated, only replaced by connect(), so one shared
+# instance can serve every backend
+_disconnected_converter = DisconnectedCaConverter(None, None)
+
+
+def _get_unique(
+    values: Dict[str, AugmentedValue],
+    extract: Callable[[AugmentedValue], Any],
+    types: str,
+) -> Any:
+    """Like get_unique, but skips the comparison dict for a single PV.
+
+    A single read/write PV is the common case, so avoid building a
+    comprehension just to check one value against itself.
+    """
+    if len(values) == 1:
+        return extract(next(iter(values.values())))
+    return get_unique({k: extract(v) for k, v in values.items()}, types)
+
+
+def _make_char_array_converter(
+    pv: str, datatype: Optional[Type], values: Dict[str, AugmentedValue], pv_dbr: Dbr
 ) -> CaConverter:
-    pv = list(values)[0]
-    pv_dbr = get_unique({k: v.datatype for k, v in values.items()}, "datatypes")
-    is_array = bool([v for v in values.values() if v.element_count > 1])
-    if is_array and datatype is str and pv_dbr == dbr.DBR_CHAR:
+    if datatype is str:
         # Override waveform of chars to be treated as string
         return CaLongStrConverter()
-    elif is_array and pv_dbr == dbr.DBR_STRING:
-        # Waveform of strings, check we wanted this
-        if datatype and datatype != Sequence[str]:
-            raise TypeError(f"{pv} has type [str] not {datatype.__name__}")
-        return CaArrayConverter(pv_dbr, None)
-    elif is_array:
-        pv_dtype = get_unique({k: v.dtype for k, v in values.items()}, "dtypes")
-        # This is an array
-        if datatype:
-            # Check we wanted an array of this type
-            dtype = get_dtype(datatype)
-            if not dtype:
-                raise TypeError(f"{pv} has type [{pv_dtype}] not {datatype.__name__}")
-            if dtype != pv_dtype:
-                raise TypeError(f"{pv} has type [{pv_dtype}] not [{dtype}]")
-        return CaArrayConverter(pv_dbr, None)
-    elif pv_dbr == dbr.DBR_ENUM and datatype is bool:
+    return _make_array_converter(pv, datatype, values, pv_dbr)
+
+
+def _make_str_array_converter(
+    pv: str, datatype: Optional[Type], values: Dict[str, AugmentedValue], pv_dbr: Dbr
+) -> CaConverter:
+    # Waveform of strings, check we wanted this
+    if datatype and datatype != Sequence[str]:
+        raise TypeError(f"{pv} has type [str] not {datatype.__name__}")
+    return CaArrayConverter(pv_dbr, None)
+
+
+def _make_array_converter(
+    pv: str, datatype: Optional[Type], values: Dict[str, AugmentedValue], pv_dbr: Dbr
+) -> CaConverter:
+    pv_dtype = _get_unique(values, lambda v: v.dtype, "dtypes")
+    # This is an array
+    if datatype:
+        # Check we wanted an array of this type
+        dtype = get_dtype(datatype)
+        if not dtype:
+            raise TypeError(f"{pv} has type [{pv_dtype}] not {datatype.__name__}")
+        if dtype != pv_dtype:
+            raise TypeError(f"{pv} has type [{pv_dtype}] not [{dtype}]")
+    return CaArrayConverter(pv_dbr, None)
+
+
+def _make_enum_converter(
+    pv: str, datatype: Optional[Type], values: Dict[str, AugmentedValue], pv_dbr: Dbr
+) -> CaConverter:
+    if datatype is bool:
         # Database can't do bools, so are often representated as enums, CA can do int
-        pv_choices_len = get_unique(
-            {k: len(v.enums) for k, v in values.items()}, "number of choices"
+        pv_choices_len = _get_unique(
+            values, lambda v: len(v.enums), "number of choices"
         )
         if pv_choices_len != 2:
             raise TypeError(f"{pv} has {pv_choices_len} choices, can't map to bool")
         return CaConverter(dbr.DBR_SHORT, dbr.DBR_SHORT)
-    elif pv_dbr == dbr.DBR_ENUM:
-        # This is an Enum
-        pv_choices = get_unique(
-            {k: tuple(v.enums) for k, v in values.items()}, "choices"
+    # This is an Enum
+    pv_choices = _get_unique(values, lambda v: tuple(v.enums), "choices")
+    enum_class = get_supported_enum_class(pv, datatype, pv_choices)
+    return CaEnumConverter(dbr.DBR_STRING, None, enum_class)
+
+
+def _make_scalar_converter(
+    pv: str, datatype: Optional[Type], values: Dict[str, AugmentedValue], pv_dbr: Dbr
+) -> CaConverter:
+    value = next(iter(values.values()))
+    # Done the dbr check, so enough to check one of the values
+    if datatype and not isinstance(value, datatype):
+        raise TypeError(
+            f"{pv} has type {type(value).__name__.replace('ca_', '')} "
+            + f"not {datatype.__name__}"
         )
-        enum_class = get_supported_enum_class(pv, datatype, pv_choices)
-        return CaEnumConverter(dbr.DBR_STRING, None, enum_class)
-    else:
-        value = list(values.values())[0]
-        # Done the dbr check, so enough to check one of the values
-        if datatype and not isinstance(value, datatype):
-            raise TypeError(
-                f"{pv} has type {type(value).__name__.replace('ca_', '')} "
-                + f"not {datatype.__name__}"
-            )
-        return CaConverter(pv_dbr, None)
+    return CaConverter(pv_dbr, None)
+
+
+# Cases needing special handling, keyed by (pv_dbr, is_array); anything else
+# falls back to the generic array or scalar converter
+_SPECIAL_CONVERTER_FACTORIES = {
+    (dbr.DBR_CHAR, True): _make_char_array_converter,
+    (dbr.DBR_STRING, True): _make_str_array_converter,
+    (dbr.DBR_ENUM, False): _make_enum_converter,
+}
+
+
+def make_converter(
+    datatype: Optional[Type], values: Dict[str, AugmentedValue]
+) -> CaConverter:
+    pv = next(iter(values))
+    pv_dbr = _get_unique(values, lambda v: v.datatype, "datatypes")
+    is_array = any(v.element_count > 1 for v in values.values())
+    factory = _SPECIAL_CONVERTER_FACTORIES.get((pv_dbr, is_array))
+    if factory is None:
+        factory = _make_array_converter if is_array else _make_scalar_converter
+    return factory(pv, datatype, values, pv_dbr)
 
 
 _tried_pyepics = False
@@ -163,14 +228,35 @@ def _use_pyepics_context_if_imported():
         _tried_pyepics = True
 
 
+class _MonitorAdapter:
+    """Bridge a camonitor AugmentedValue to a ReadingValueCallback.
+
+    Holds the bound converter methods in slots so each update is a couple of
+    C-level offset loads rather than a closure cell dereference.
+    """
+
+    __slots__ = ("reading", "value", "callback")
+
+    def __init__(self, converter: CaConverter, callback: ReadingValueCallback):
+        self.reading = converter.reading
+        self.value = converter.value
+        self.callback = callback
+
+    def __call__(self, v: AugmentedValue) -> None:
+        self.callback(self.reading(v), self.value(v))
+
+
 class CaSignalBackend(SignalBackend[T]):
     def __init__(self, datatype: Optional[Type[T]], read_pv: str, write_pv: str):
         self.datatype = datatype
         self.read_pv = read_pv
         self.write_pv = write_pv
         self.initial_values: Dict[str, AugmentedValue] = {}
-        self.converter: CaConverter = DisconnectedCaConverter(None, None)
+        self.converter: CaConverter = _disconnected_converter
         self.subscription: Optional[Subscription] = None
+        self._caget_ctrl = self._caget_time = self._caget_raw = self._caget_disconnected
+        self._read_dbr: Optional[Dbr] = None
+        self._write_dbr: Optional[Dbr] = None
 
     def source(self, name: str):
         return f"ca://{self.read_pv}"
@@ -196,6 +282,28 @@ class CaSignalBackend(SignalBackend[T]):
             # The same, so only need to connect one
             await self._store_initial_value(self.read_pv, timeout=timeout)
         self.converter = make_converter(self.datatype, self.initial_values)
+        # Cache the dbr fields so put and get_setpoint skip a converter
+        # attribute lookup per call
+        self._read_dbr = self.converter.read_dbr
+        self._write_dbr = self.converter.write_dbr
+        # Specialize the caget call for each format up front so the hot read
+        # paths don't rebuild the same keyword arguments per call
+        for attr, format in (
+            ("_caget_ctrl", FORMAT_CTRL),
+            ("_caget_time", FORMAT_TIME),
+            ("_caget_raw", FORMAT_RAW),
+        ):
+            setattr(
+                self,
+                attr,
+                functools.partial(
+                    caget,
+                    self.read_pv,
+                    datatype=self.converter.read_dbr,
+                    format=format,
+                    timeout=None,
+                ),
+            )
 
     async def put(self, value: Optional[T], wait=True, timeout=None):
         if value is None:
@@ -205,35 +313,31 @@ class CaSignalBackend(SignalBackend[T]):
         await caput(
             self.write_pv,
             write_value,
-            datatype=self.converter.write_dbr,
+            datatype=self._write_dbr,
             wait=wait,
             timeout=timeout,
         )
 
-    async def _caget(self, format: Format) -> AugmentedValue:
-        return await caget(
-            self.read_pv,
-            datatype=self.converter.read_dbr,
-            format=format,
-            timeout=None,
-        )
+    @staticmethod
+    async def _caget_disconnected() -> AugmentedValue:
+        raise NotImplementedError("No PV has been set as connect() has not been called")
 
     async def get_datakey(self, source: str) -> DataKey:
-        value = await self._caget(FORMAT_CTRL)
+        value = await self._caget_ctrl()
         return self.converter.get_datakey(source, value)
 
     async def get_reading(self) -> Reading:
-        value = await self._caget(FORMAT_TIME)
+        value = await self._caget_time()
         return self.converter.reading(value)
 
     async def get_value(self) -> T:
-        value = await self._caget(FORMAT_RAW)
+        value = await self._caget_raw()
         return self.converter.value(value)
 
     async def get_setpoint(self) -> T:
         value = await caget(
             self.write_pv,
-            datatype=self.converter.read_dbr,
+            datatype=self._read_dbr,
             format=FORMAT_RAW,
             timeout=None,
         )
@@ -246,7 +350,7 @@ class CaSignalBackend(SignalBackend[T]):
             ), "Cannot set a callback when one is already set"
             self.subscription = camonitor(
                 self.read_pv,
-                lambda v: callback(self.converter.reading(v), self.converter.value(v)),
+                _MonitorAdapter(self.converter, callback),
                 datatype=self.converter.read_dbr,
                 format=FORMAT_TIME,
             )
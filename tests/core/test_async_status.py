@@ -59,6 +59,13 @@ async def test_async_status_success_if_cancelled(normal_coroutine):
     assert isinstance(status.exception(), asyncio.CancelledError)
 
 
+async def test_async_status_completed():
+    status = AsyncStatus.completed()
+    assert status.done
+    assert status.success
+    await status
+
+
 async def coroutine_to_wrap(time: float):
     await asyncio.sleep(time)
 
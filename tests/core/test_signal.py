@@ -39,18 +39,20 @@ class MySignal(Signal):
         pass
 
 
-def test_signals_equality_raises():
+def test_signals_compare_by_identity():
     sim_backend = SimSignalBackend(str)
 
     s1 = MySignal(sim_backend)
     s2 = MySignal(sim_backend)
+    assert s1 == s1
+    assert s1 != s2
     with pytest.raises(
         TypeError,
         match=re.escape(
             "Can't compare two Signals, did you mean await signal.get_value() instead?"
         ),
     ):
-        s1 == s2
+        s1 < s2
     with pytest.raises(
         TypeError,
         match=re.escape("'>' not supported between instances of 'MySignal' and 'int'"),
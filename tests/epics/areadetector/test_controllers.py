@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -33,6 +34,8 @@ async def ad(RE) -> ADSimController:
 async def test_ad_controller(RE, ad: ADSimController):
     with patch("ophyd_async.core.signal.wait_for_value", return_value=None):
         await ad.arm(num=1)
+    # Give the acquire put task a chance to run as wait_for_value is mocked
+    await asyncio.sleep(0)
 
     driver = ad.driver
     assert await driver.num_images.get_value() == 1
@@ -50,6 +53,8 @@ async def test_ad_controller(RE, ad: ADSimController):
 async def test_pilatus_controller(RE, pilatus: PilatusController):
     with patch("ophyd_async.core.signal.wait_for_value", return_value=None):
         await pilatus.arm(num=1, trigger=DetectorTrigger.constant_gate)
+    # Give the acquire put task a chance to run as wait_for_value is mocked
+    await asyncio.sleep(0)
 
     driver = pilatus._drv
     assert await driver.num_images.get_value() == 1
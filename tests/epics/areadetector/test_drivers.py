@@ -37,8 +37,9 @@ async def test_start_acquiring_driver_and_ensure_status_fails_after_some_time(
     set_sim_value(driver.detector_state, DetectorState.Idle)
 
     async def wait_then_fail():
-        await asyncio.sleep(0)
         set_sim_value(driver.detector_state, DetectorState.Disconnected)
+        # Yield so the acquiring status sees the bad state
+        await asyncio.sleep(0)
 
     acquiring = await start_acquiring_driver_and_ensure_status(driver, timeout=0.1)
     await wait_then_fail()
@@ -1,6 +1,7 @@
 import asyncio
 import time
 
+import pytest
 from bluesky.plans import spiral_square
 from bluesky.run_engine import RunEngine
 
@@ -47,6 +48,10 @@ async def test_stop():
     await asyncio.sleep(0.2)
     m1.stop()
 
+    # wait for the cancellation to propagate to the move task
+    with pytest.raises(RuntimeError, match="Motor was stopped"):
+        await move_status
+
     new_pos = await m1.user_readback.get_value()
 
     assert move_status.done